@@ -0,0 +1,88 @@
+"""Time and memory benchmark for extracting and exporting scraped stores.
+
+Runs UmicoScraper.extract_useful_data over synthetic API items, then
+save_to_csv, and reports wall time per stage plus tracemalloc memory: what
+the scraper still holds after extraction, and the peak over the whole run.
+
+    python bench_scraper.py [rows]
+
+To compare against another revision, run a copy next to its scraper.py:
+
+    git show <rev>:scraper.py > /tmp/rev/scraper.py
+    cp bench_scraper.py /tmp/rev/ && python /tmp/rev/bench_scraper.py
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from scraper import UmicoScraper
+
+FULL_ITEM = {
+    'name': 'Myshops',
+    'partner_contacts': [{'contact_type': 'work', 'contact_value': '+994558898989'}],
+    'website': 'https://myshops.az',
+    'cashback_percentage': 15.0,
+    'ratings': {'marketing_name_rating_value': 4.8, 'marketing_name_session_count': 80},
+    'categories': [{'name_az': 'Qurğu'}, {'name_az': 'TV və video'}],
+    'main_category': {'name_az': 'Qurğu'},
+    'active': True,
+    'partner_social_accounts': [{'social_network': 'instagram', 'link': 'https://instagram.com/x'}],
+    'point_of_sales': [{
+        'city': {'name_az': 'Bakı'},
+        'district': {'name_az': 'Nəsimi'},
+        'street_az': 'Nizami',
+        'house': '10',
+        'location': '40.37,49.84',
+        'pos_operating_hours': [{'day_of_week': 1, 'from': '09:00', 'to': '18:00'}],
+    }],
+}
+BARE_ITEM = {'name': 'Bare', 'ratings': {}, 'main_category': {'name_az': 'Qurğu'}}
+
+
+def extract(scraper: UmicoScraper, items: list):
+    """Feed items through the scraper, whichever extract contract it has"""
+    for item in items:
+        row = scraper.extract_useful_data(item)
+        # Older revisions return the row and leave appending to the caller
+        if isinstance(row, dict):
+            scraper.all_data.append(row)
+
+
+def run(items: list, filename: str) -> tuple:
+    """Return (extract, export) wall times in seconds"""
+    scraper = UmicoScraper()
+    start = time.perf_counter()
+    extract(scraper, items)
+    extracted = time.perf_counter()
+    scraper.save_to_csv(filename)
+    return extracted - start, time.perf_counter() - extracted
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    items = [FULL_ITEM, BARE_ITEM] * (rows // 2)
+    filename = os.path.join(tempfile.mkdtemp(), 'bench.csv')
+
+    extract_time, export_time = run(items, filename)
+
+    # Separate pass: tracemalloc slows allocation-heavy code down
+    tracemalloc.start()
+    scraper = UmicoScraper()
+    extract(scraper, items)
+    held, _ = tracemalloc.get_traced_memory()
+    scraper.save_to_csv(filename)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"rows:    {len(items)}")
+    print(f"extract: {extract_time:.2f}s")
+    print(f"export:  {export_time:.2f}s")
+    print(f"total:   {extract_time + export_time:.2f}s")
+    print(f"held:    {held / 2 ** 20:.1f} MB")
+    print(f"peak:    {peak / 2 ** 20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
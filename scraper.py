@@ -1,10 +1,147 @@
 import requests
+import numpy as np
 import pandas as pd
 import json
-from typing import List, Dict
+from array import array
+from typing import Dict
 import time
 
+
+class StoreColumns:
+    """Column-oriented accumulator for scraped stores.
+
+    Rows are queued as plain tuples in COLUMNS order and converted in bulk
+    every CHUNK_SIZE rows: numbers into float64/int64 arrays (counts with an
+    NA mask), active into a bool array, and city, district and main_category
+    into integer codes plus a category dict. Other text columns keep the
+    original str objects. Values that cannot be parsed become NA.
+
+    to_dataframe() builds a new frame that owns its arrays, so editing it
+    never reaches the builder. pandas 3 wraps the numeric arrays as they are;
+    older versions may copy same-dtype columns once while consolidating.
+    """
+
+    COLUMNS = [
+        'store_name', 'phone_numbers', 'website', 'cashback_percentage', 'rating',
+        'rating_count', 'categories', 'main_category', 'active', 'instagram',
+        'facebook', 'notes', 'city', 'district', 'street', 'house',
+        'address_notes', 'coordinates', 'operating_hours', 'total_locations',
+    ]
+    FLOAT_COLUMNS = ('cashback_percentage', 'rating')
+    INT_COLUMNS = ('rating_count', 'total_locations')
+    BOOL_COLUMNS = ('active',)
+    CATEGORY_COLUMNS = ('main_category', 'city', 'district')
+    STRING_COLUMNS = (
+        'store_name', 'phone_numbers', 'website', 'categories', 'instagram',
+        'facebook', 'notes', 'street', 'house', 'address_notes', 'coordinates',
+        'operating_hours',
+    )
+    CHUNK_SIZE = 4096
+
+    def __init__(self):
+        self.length = 0
+        self.pending = []
+        self.chunks = {
+            name: [] for name in
+            self.FLOAT_COLUMNS + self.INT_COLUMNS + self.BOOL_COLUMNS + self.CATEGORY_COLUMNS
+        }
+        self.missing = {name: [] for name in self.INT_COLUMNS}
+        self.categories = {name: {} for name in self.CATEGORY_COLUMNS}
+        self.strings = {name: [] for name in self.STRING_COLUMNS}
+
+    def __len__(self) -> int:
+        return self.length + len(self.pending)
+
+    def append(self, row: tuple):
+        """Queue a single store given as a tuple in COLUMNS order"""
+        self.pending.append(row)
+        if len(self.pending) >= self.CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Convert the queued rows into typed column chunks"""
+        if not self.pending:
+            return
+
+        values = dict(zip(self.COLUMNS, zip(*self.pending)))
+
+        for name in self.FLOAT_COLUMNS:
+            numbers = pd.to_numeric(np.asarray(values[name], dtype=object), errors='coerce')
+            self.chunks[name].append(numbers.astype(np.float64))
+
+        # Counts must be whole numbers; anything else becomes NA rather than truncated
+        for name in self.INT_COLUMNS:
+            numbers = pd.to_numeric(np.asarray(values[name], dtype=object), errors='coerce')
+            numbers = numbers.astype(np.float64)
+            missing = ~np.isfinite(numbers) | (numbers != np.floor(numbers))
+            self.chunks[name].append(np.where(missing, 0, numbers).astype(np.int64))
+            self.missing[name].append(missing)
+
+        for name in self.BOOL_COLUMNS:
+            self.chunks[name].append(np.asarray(values[name], dtype=object).astype(np.bool_))
+
+        # Factorize the chunk, then map its uniques onto the running category codes
+        for name in self.CATEGORY_COLUMNS:
+            codes, uniques = pd.factorize(np.asarray(values[name], dtype=object))
+            categories = self.categories[name]
+            remap = np.array(
+                [categories.setdefault(str(value), len(categories)) for value in uniques] + [-1],
+                dtype=np.int64,
+            )
+            self.chunks[name].append(remap[codes])
+
+        for name in self.STRING_COLUMNS:
+            self.strings[name].extend(values[name])
+
+        self.length += len(self.pending)
+        self.pending = []
+
+    @staticmethod
+    def _joined(chunks: list, dtype) -> np.ndarray:
+        """Concatenate chunks into a new array owned by the caller"""
+        if not chunks:
+            return np.empty(0, dtype=dtype)
+        return np.concatenate(chunks)
+
+    def _arrays(self) -> Dict:
+        """Build the final column arrays, keyed by column name"""
+        self.flush()
+
+        arrays = {name: self._joined(self.chunks[name], np.float64)
+                  for name in self.FLOAT_COLUMNS}
+        for name in self.INT_COLUMNS:
+            arrays[name] = pd.arrays.IntegerArray(
+                self._joined(self.chunks[name], np.int64),
+                self._joined(self.missing[name], np.bool_),
+            )
+        for name in self.BOOL_COLUMNS:
+            arrays[name] = self._joined(self.chunks[name], np.bool_)
+        for name in self.CATEGORY_COLUMNS:
+            arrays[name] = pd.Categorical.from_codes(
+                self._joined(self.chunks[name], np.int64),
+                categories=pd.Index(list(self.categories[name]), dtype='str'),
+            )
+        for name in self.STRING_COLUMNS:
+            arrays[name] = pd.array(self.strings[name], dtype='str')
+        return arrays
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a new DataFrame from the accumulated columns"""
+        arrays = self._arrays()
+        return pd.DataFrame({name: arrays[name] for name in self.COLUMNS}, copy=False)
+
+
 class UmicoScraper:
+    EMPTY_ADDRESS = {
+        'city': '',
+        'district': '',
+        'street': '',
+        'house': '',
+        'address_notes': '',
+        'location': '',
+        'operating_hours': '',
+    }
+
     def __init__(self):
         self.base_url = "https://search.umico.az/v2/marketing_names"
         self.headers = {
@@ -15,7 +152,8 @@ class UmicoScraper:
             "referer": "https://birmarket.az/",
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36"
         }
-        self.all_data = []
+        self.all_data = StoreColumns()
+        self._frame = None
 
     def fetch_page(self, page: int, per_page: int = 60) -> Dict:
         """Fetch a single page of data from the API"""
@@ -36,8 +174,8 @@ class UmicoScraper:
             print(f"Error fetching page {page}: {e}")
             return None
 
-    def extract_useful_data(self, item: Dict) -> Dict:
-        """Extract useful fields from a single item"""
+    def extract_useful_data(self, item: Dict):
+        """Extract useful fields from a single item and append them to self.all_data (returns None)"""
         # Extract phone numbers
         phones = []
         if item.get('partner_contacts'):
@@ -83,52 +221,35 @@ class UmicoScraper:
         if item.get('ratings') and item['ratings'].get('marketing_name_rating_value'):
             rating = item['ratings']['marketing_name_rating_value']
 
-        # Build the result
-        result = {
-            'store_name': item.get('name', ''),
-            'phone_numbers': ', '.join(phones),
-            'website': item.get('website', ''),
-            'cashback_percentage': item.get('cashback_percentage', ''),
-            'rating': rating,
-            'rating_count': item.get('ratings', {}).get('marketing_name_session_count', ''),
-            'categories': ' | '.join(categories),
-            'main_category': item.get('main_category', {}).get('name_az', ''),
-            'active': item.get('active', False),
-            'instagram': social_media.get('instagram', ''),
-            'facebook': social_media.get('facebook', ''),
-            'notes': item.get('notes_az', ''),
-        }
-
         # Add address information (first location if multiple exist)
-        if addresses:
-            first_address = addresses[0]
-            result.update({
-                'city': first_address['city'],
-                'district': first_address['district'],
-                'street': first_address['street'],
-                'house': first_address['house'],
-                'address_notes': first_address['address_notes'],
-                'coordinates': first_address['location'],
-                'operating_hours': first_address['operating_hours'],
-            })
-
-            # If multiple locations, add a count
-            result['total_locations'] = len(addresses)
-        else:
-            result.update({
-                'city': '',
-                'district': '',
-                'street': '',
-                'house': '',
-                'address_notes': '',
-                'coordinates': '',
-                'operating_hours': '',
-                'total_locations': 0
-            })
-
-        return result
-
-    def scrape_all_pages(self, max_pages: int = 100):
+        first_address = addresses[0] if addresses else self.EMPTY_ADDRESS
+
+        # Positional, in StoreColumns.COLUMNS order
+        self.all_data.append((
+            item.get('name', ''),
+            ', '.join(phones),
+            item.get('website', ''),
+            item.get('cashback_percentage', ''),
+            rating,
+            item.get('ratings', {}).get('marketing_name_session_count', ''),
+            ' | '.join(categories),
+            item.get('main_category', {}).get('name_az', ''),
+            item.get('active', False),
+            social_media.get('instagram', ''),
+            social_media.get('facebook', ''),
+            item.get('notes_az', ''),
+            first_address['city'],
+            first_address['district'],
+            first_address['street'],
+            first_address['house'],
+            first_address['address_notes'],
+            first_address['location'],
+            first_address['operating_hours'],
+            # If multiple locations, keep a count
+            len(addresses),
+        ))
+
+    def scrape_all_pages(self, max_pages: int = 100) -> StoreColumns:
         """Scrape all pages until no more data is returned"""
         print("Starting to scrape data from Umico API...")
         page = 1
@@ -143,8 +264,7 @@ class UmicoScraper:
 
             # Extract useful data from each item
             for item in data['data']:
-                useful_data = self.extract_useful_data(item)
-                self.all_data.append(useful_data)
+                self.extract_useful_data(item)
 
             print(f"Extracted {len(data['data'])} items from page {page}")
 
@@ -159,13 +279,19 @@ class UmicoScraper:
         print(f"\nTotal items scraped: {len(self.all_data)}")
         return self.all_data
 
+    def _dataframe(self) -> pd.DataFrame:
+        """DataFrame shared by save_to_csv and save_to_xlsx, rebuilt only after new rows"""
+        if self._frame is None or len(self._frame) != len(self.all_data):
+            self._frame = self.all_data.to_dataframe()
+        return self._frame
+
     def save_to_csv(self, filename: str = 'umico_stores.csv'):
         """Save the scraped data to CSV"""
         if not self.all_data:
             print("No data to save!")
             return
 
-        df = pd.DataFrame(self.all_data)
+        df = self._dataframe()
         df.to_csv(filename, index=False, encoding='utf-8-sig')
         print(f"Data saved to {filename}")
 
@@ -175,7 +301,7 @@ class UmicoScraper:
             print("No data to save!")
             return
 
-        df = pd.DataFrame(self.all_data)
+        df = self._dataframe()
 
         # Create Excel writer with openpyxl engine
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
@@ -185,7 +311,7 @@ class UmicoScraper:
             worksheet = writer.sheets['Stores']
             for idx, col in enumerate(df.columns):
                 max_length = max(
-                    df[col].astype(str).apply(len).max(),
+                    df[col].astype(str).str.len().fillna(0).max(),
                     len(col)
                 ) + 2
                 worksheet.column_dimensions[chr(65 + idx)].width = min(max_length, 50)
@@ -0,0 +1,125 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scraper import StoreColumns, UmicoScraper
+
+FULL_ITEM = {
+    'name': 'Myshops',
+    'partner_contacts': [{'contact_type': 'work', 'contact_value': '+994558898989'}],
+    'website': 'https://myshops.az',
+    'cashback_percentage': 15.0,
+    'ratings': {'marketing_name_rating_value': 4.8, 'marketing_name_session_count': 80},
+    'categories': [{'name_az': 'Qurğu'}, {'name_az': 'TV və video'}],
+    'main_category': {'name_az': 'Qurğu'},
+    'active': True,
+    'partner_social_accounts': [{'social_network': 'instagram', 'link': 'https://instagram.com/x'}],
+    'point_of_sales': [{
+        'city': {'name_az': 'Bakı'},
+        'district': {'name_az': 'Nəsimi'},
+        'street_az': 'Nizami',
+        'house': '10',
+        'location': '40.37,49.84',
+        'pos_operating_hours': [{'day_of_week': 1, 'from': '09:00', 'to': '18:00'}],
+    }, {
+        'city': {'name_az': 'Gəncə'},
+    }],
+}
+
+# No rating, no addresses and no cashback_percentage
+BARE_ITEM = {'name': 'Bare', 'ratings': {}, 'main_category': {'name_az': 'Qurğu'}}
+
+# Rows as the list-of-dicts extractor produced them for the items above
+FULL_ROW = {
+    'store_name': 'Myshops', 'phone_numbers': '+994558898989', 'website': 'https://myshops.az',
+    'cashback_percentage': 15.0, 'rating': 4.8, 'rating_count': 80,
+    'categories': 'Qurğu | TV və video', 'main_category': 'Qurğu', 'active': True,
+    'instagram': 'https://instagram.com/x', 'facebook': '', 'notes': '',
+    'city': 'Bakı', 'district': 'Nəsimi', 'street': 'Nizami', 'house': '10',
+    'address_notes': '', 'coordinates': '40.37,49.84', 'operating_hours': '1: 09:00-18:00',
+    'total_locations': 2,
+}
+BARE_ROW = {
+    'store_name': 'Bare', 'phone_numbers': '', 'website': '',
+    'cashback_percentage': '', 'rating': None, 'rating_count': '',
+    'categories': '', 'main_category': 'Qurğu', 'active': False,
+    'instagram': '', 'facebook': '', 'notes': '',
+    'city': '', 'district': '', 'street': '', 'house': '',
+    'address_notes': '', 'coordinates': '', 'operating_hours': '',
+    'total_locations': 0,
+}
+
+
+def test_csv_matches_list_of_dicts(tmp_path):
+    scraper = UmicoScraper()
+    # Small chunks so category codes are remapped across several flushes
+    scraper.all_data.CHUNK_SIZE = 2
+    items = (FULL_ITEM, BARE_ITEM, FULL_ITEM, BARE_ITEM, FULL_ITEM)
+    for item in items:
+        scraper.extract_useful_data(item)
+
+    scraper.save_to_csv(tmp_path / 'columns.csv')
+    rows = [FULL_ROW if item is FULL_ITEM else BARE_ROW for item in items]
+    pd.DataFrame(rows).to_csv(tmp_path / 'dicts.csv', index=False, encoding='utf-8-sig')
+
+    assert (tmp_path / 'columns.csv').read_bytes() == (tmp_path / 'dicts.csv').read_bytes()
+
+
+def test_frame_unchanged_by_later_appends():
+    scraper = UmicoScraper()
+    scraper.extract_useful_data(FULL_ITEM)
+    scraper.extract_useful_data(BARE_ITEM)
+    before = scraper.all_data.to_dataframe()
+    snapshot = before.copy()
+
+    scraper.extract_useful_data(BARE_ITEM)
+    scraper.extract_useful_data(FULL_ITEM)
+
+    pd.testing.assert_frame_equal(before, snapshot)
+    after = scraper.all_data.to_dataframe()
+    assert len(after) == 4
+    assert after['store_name'].tolist() == ['Myshops', 'Bare', 'Bare', 'Myshops']
+    assert after['city'].tolist() == ['Bakı', '', '', 'Bakı']
+
+
+def test_editing_frame_does_not_change_export(tmp_path):
+    scraper = UmicoScraper()
+    scraper.extract_useful_data(FULL_ITEM)
+    scraper.extract_useful_data(BARE_ITEM)
+
+    df = scraper.all_data.to_dataframe()
+    df.loc[0, 'rating'] = 1.0
+    df['extra'] = 1
+    scraper.extract_useful_data(FULL_ITEM)
+
+    scraper.save_to_csv(tmp_path / 'columns.csv')
+    pd.DataFrame([FULL_ROW, BARE_ROW, FULL_ROW]).to_csv(
+        tmp_path / 'dicts.csv', index=False, encoding='utf-8-sig'
+    )
+    assert (tmp_path / 'columns.csv').read_bytes() == (tmp_path / 'dicts.csv').read_bytes()
+
+
+@pytest.mark.skipif(int(pd.__version__.split('.')[0]) < 3,
+                    reason='older pandas consolidates same-dtype columns')
+def test_numeric_columns_not_copied_into_frame():
+    columns = StoreColumns()
+    for row in (FULL_ROW, BARE_ROW):
+        columns.append(tuple(row[name] for name in StoreColumns.COLUMNS))
+    arrays = columns._arrays()
+    columns._arrays = lambda: arrays
+
+    df = columns.to_dataframe()
+    for name in StoreColumns.FLOAT_COLUMNS + StoreColumns.BOOL_COLUMNS:
+        assert np.shares_memory(df[name].to_numpy(), arrays[name])
+
+
+def test_bad_values_become_na():
+    columns = StoreColumns()
+    for rating_count in ('n/a', 2.9, '12'):
+        row = dict(FULL_ROW, rating_count=rating_count, cashback_percentage='x')
+        columns.append(tuple(row[name] for name in StoreColumns.COLUMNS))
+
+    df = columns.to_dataframe()
+    assert df['rating_count'].isna().tolist() == [True, True, False]
+    assert df['rating_count'][2] == 12
+    assert df['cashback_percentage'].isna().all()